@@ -0,0 +1,88 @@
+/*
+ * Compiled FABRIK kernel for the Advanced Character Rig System
+ * Plain C with no Python dependency, loaded through ctypes by ik_kernel.py
+ *
+ * Build with: python setup_ik_kernel.py
+ */
+
+#include <math.h>
+#include <stddef.h>
+#include <string.h>
+
+#ifdef _WIN32
+#define IK_EXPORT __declspec(dllexport)
+#else
+#define IK_EXPORT
+#endif
+
+/* Largest joint dimension the kernel keeps a stack copy of the root for */
+#define IK_MAX_DIM 4
+
+static inline float rsqrtf_fast(float x)
+{
+    /* Under -ffast-math this lowers to the hardware reciprocal square root
+       estimate refined by a Newton-Raphson step */
+    return 1.0f / sqrtf(x);
+}
+
+/* Move joint along the anchor->joint line so it sits `length` from anchor */
+static inline void reach(float *joint, const float *anchor, float length, int dim)
+{
+    float distance_sq = 0.0f;
+    for (int k = 0; k < dim; ++k) {
+        const float d = joint[k] - anchor[k];
+        distance_sq += d * d;
+    }
+    if (distance_sq > 1e-12f) {  /* Avoid division by zero */
+        const float scale = length * rsqrtf_fast(distance_sq);
+        for (int k = 0; k < dim; ++k)
+            joint[k] = anchor[k] + (joint[k] - anchor[k]) * scale;
+    }
+}
+
+/*
+ * Solve one chain with FABRIK, updating positions in place
+ *
+ * positions:    n * dim row-major float32 joint positions
+ * bone_lengths: n - 1 rest lengths
+ * target:       dim end effector target
+ *
+ * Returns the number of iterations run, or -1 if dim exceeds IK_MAX_DIM.
+ */
+IK_EXPORT int fabrik_solve(float *positions, const float *bone_lengths, int n, int dim,
+                           const float *target, float tol, int max_iter)
+{
+    float base[IK_MAX_DIM];
+    float *end_effector = positions + (size_t)(n - 1) * dim;
+    const float tol_sq = tol * tol;
+
+    if (dim > IK_MAX_DIM)
+        return -1;
+
+    memcpy(base, positions, dim * sizeof(float));
+
+    for (int iteration = 0; iteration < max_iter; ++iteration) {
+        /* Forward reaching phase (joint 0 is re-pinned to the base below,
+           so it is not moved here) */
+        memcpy(end_effector, target, dim * sizeof(float));
+        for (int i = n - 2; i >= 1; --i)
+            reach(positions + (size_t)i * dim, positions + (size_t)(i + 1) * dim,
+                  bone_lengths[i], dim);
+
+        /* Backward reaching phase */
+        memcpy(positions, base, dim * sizeof(float));
+        for (int i = 0; i < n - 1; ++i)
+            reach(positions + (size_t)(i + 1) * dim, positions + (size_t)i * dim,
+                  bone_lengths[i], dim);
+
+        /* Check if we've converged */
+        float error_sq = 0.0f;
+        for (int k = 0; k < dim; ++k) {
+            const float d = end_effector[k] - target[k];
+            error_sq += d * d;
+        }
+        if (error_sq < tol_sq)
+            return iteration + 1;
+    }
+    return max_iter;
+}
@@ -0,0 +1,64 @@
+"""
+ctypes bindings for the compiled FABRIK kernel in ik_kernel.c
+Build the shared library first with: python setup_ik_kernel.py
+"""
+
+import ctypes
+import os
+import numpy as np
+
+MAX_DIM = 4
+
+
+def _find_library() -> str:
+    """Locate the built _ik_kernel shared library next to this file"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in ('_ik_kernel.so', '_ik_kernel.dylib', '_ik_kernel.dll'):
+        path = os.path.join(here, name)
+        if os.path.exists(path):
+            return path
+    raise ImportError("Compiled IK kernel not found. "
+                      "Build it with: python setup_ik_kernel.py")
+
+
+_float_array = np.ctypeslib.ndpointer(dtype=np.float32, flags='C_CONTIGUOUS')
+
+_lib = ctypes.CDLL(_find_library())
+_lib.fabrik_solve.argtypes = [
+    _float_array,   # positions
+    _float_array,   # bone_lengths
+    ctypes.c_int,   # n
+    ctypes.c_int,   # dim
+    _float_array,   # target
+    ctypes.c_float,  # tol
+    ctypes.c_int,   # max_iter
+]
+_lib.fabrik_solve.restype = ctypes.c_int
+
+
+def fabrik_solve(positions: np.ndarray, bone_lengths: np.ndarray, target: np.ndarray,
+                 tolerance: float, max_iterations: int) -> int:
+    """
+    Run the C FABRIK kernel on one chain, updating positions in place
+    
+    Args:
+        positions: (n, dim) C-contiguous float32 joint positions
+        bone_lengths: (n - 1,) float32 rest lengths
+        target: (dim,) float32 end effector target
+        tolerance: Convergence tolerance on end effector distance
+        max_iterations: Maximum number of forward/backward iterations
+        
+    Returns:
+        Number of iterations run
+    """
+    if positions.ndim != 2 or positions.shape[0] < 1:
+        raise ValueError(f"positions must have shape (n, dim) with n >= 1, got {positions.shape}")
+    n, dim = positions.shape
+    if dim > MAX_DIM:
+        raise ValueError(f"Chains of dimension {dim} are not supported (max {MAX_DIM})")
+    if bone_lengths.shape != (n - 1,):
+        raise ValueError(f"bone_lengths must have shape ({n - 1},), got {bone_lengths.shape}")
+    if target.shape != (dim,):
+        raise ValueError(f"target must have shape ({dim},), got {target.shape}")
+    return _lib.fabrik_solve(positions, bone_lengths, n, dim, target,
+                             tolerance, max_iterations)
@@ -3,16 +3,67 @@ Advanced IK Solvers for Character Rigging
 Implements FABRIK and CCD algorithms with performance optimizations
 """
 
+import math
 import numpy as np
 from typing import List, Tuple, Optional
 import time
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function uncompiled"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+def _aligned_empty(shape: Tuple[int, ...], dtype=np.float32,
+                   alignment: int = 32) -> np.ndarray:
+    """Allocate an uninitialised C-contiguous array starting on an `alignment`-byte boundary"""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -buffer.ctypes.data % alignment
+    return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
+
 
 class Joint:
-    """Represents a joint in a kinematic chain"""
+    """
+    Represents a joint in a kinematic chain
+
+    Once a joint is added to an IKChain its position becomes a view into the
+    chain's packed positions array, so reads and writes go straight to the
+    buffer the solvers operate on.
+    """
     def __init__(self, position: np.ndarray, name: str = ""):
-        self.position = np.ndarray(position, dtype=np.float32)
+        self._position = np.asarray(position, dtype=np.float32)
+        self._chain: Optional['IKChain'] = None
+        self._index = 0
         self.name = name
+
+    @property
+    def position(self) -> np.ndarray:
+        if self._chain is not None:
+            return self._chain.positions[self._index]
+        return self._position
+
+    @position.setter
+    def position(self, value: np.ndarray):
+        if self._chain is not None:
+            self._chain.positions[self._index] = value
+        else:
+            self._position = np.asarray(value, dtype=np.float32)
+
+    def _bind(self, chain: 'IKChain', index: int):
+        """Attach this joint to a row of the chain's positions array"""
+        self._chain = chain
+        self._index = index
         
     def distance_to(self, other: 'Joint') -> float:
         """Calculate distance to another joint"""
@@ -20,23 +71,343 @@ class Joint:
 
 
 class IKChain:
-    """Represents a kinematic chain for IK solving"""
+    """
+    Represents a kinematic chain for IK solving
+
+    Joint positions are stored structure-of-arrays style in a single
+    contiguous, 32-byte aligned (n, dim) float32 array; the Joint objects
+    are thin proxies onto its rows.
+    """
     def __init__(self, joints: List[Joint]):
         self.joints = joints
+        stacked = np.stack([j.position for j in joints])
+        self.positions = _aligned_empty(stacked.shape)
+        np.copyto(self.positions, stacked)
+        assert self.positions.flags['C_CONTIGUOUS']
+        for i, joint in enumerate(joints):
+            joint._bind(self, i)
         self.bone_lengths = self._calculate_bone_lengths()
-        self.total_length = sum(self.bone_lengths)
+        self.total_length = float(self.bone_lengths.sum())
+        self.total_length_sq = self.total_length * self.total_length
         
-    def _calculate_bone_lengths(self) -> List[float]:
+    def _calculate_bone_lengths(self) -> np.ndarray:
         """Pre-calculate bone lengths for efficiency"""
-        lengths = []
-        for i in range(len(self.joints) - 1):
-            lengths.append(self.joints[i].distance_to(self.joints[i + 1]))
-        return lengths
+        return np.linalg.norm(np.diff(self.positions, axis=0), axis=1).astype(np.float32, copy=False)
+    
+    def reset(self, positions: np.ndarray):
+        """
+        Restore joint positions (e.g. the rest pose) without rebuilding the chain
+        
+        Bone lengths and total length are kept, so positions should have the
+        same bone lengths as the pose the chain was built from.
+        """
+        if np.shape(positions) != self.positions.shape:
+            raise ValueError(f"Expected positions of shape {self.positions.shape}, "
+                             f"got {np.shape(positions)}")
+        np.copyto(self.positions, positions)
     
     def is_reachable(self, target: np.ndarray) -> bool:
         """Check if target is within reach of the chain"""
-        distance = np.linalg.norm(target - self.joints[0].position)
-        return distance <= self.total_length
+        offset = target - self.positions[0]
+        return float(offset @ offset) <= self.total_length_sq
+
+
+def _place_joint(joint: List[float], anchor: List[float], length: float):
+    """Move joint in place along the anchor->joint line to sit `length` from anchor"""
+    if len(joint) == 2:
+        dx = joint[0] - anchor[0]
+        dy = joint[1] - anchor[1]
+        distance = math.hypot(dx, dy)
+        if distance > 1e-6:  # Avoid division by zero
+            scale = length / distance
+            joint[0] = anchor[0] + dx * scale
+            joint[1] = anchor[1] + dy * scale
+    else:
+        dx = joint[0] - anchor[0]
+        dy = joint[1] - anchor[1]
+        dz = joint[2] - anchor[2]
+        distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+        if distance > 1e-6:
+            scale = length / distance
+            joint[0] = anchor[0] + dx * scale
+            joint[1] = anchor[1] + dy * scale
+            joint[2] = anchor[2] + dz * scale
+
+
+@njit(cache=True, fastmath=True, inline='always')
+def _reach_kernel(positions, i, anchor, length):
+    """Compiled counterpart of _place_joint operating on rows of positions"""
+    dim = positions.shape[1]
+    distance_sq = 0.0
+    for k in range(dim):
+        d = positions[i, k] - positions[anchor, k]
+        distance_sq += d * d
+    distance = math.sqrt(distance_sq)
+    if distance > 1e-6:
+        scale = length / distance
+        for k in range(dim):
+            positions[i, k] = (positions[anchor, k] +
+                               (positions[i, k] - positions[anchor, k]) * scale)
+
+
+@njit(cache=True, fastmath=True)
+def _fabrik_kernel(positions, bone_lengths, target, base, tol, max_iter):
+    """
+    Compiled FABRIK iterations, updating positions in place
+
+    Both sweeps run in one compiled loop body with _reach_kernel forced
+    inline and no allocation. The forward sweep stops at joint 1, because
+    joint 0 is immediately re-pinned to the base, which saves one joint
+    update per iteration.
+
+    Args:
+        positions: (n, dim) float32 joint positions
+        bone_lengths: (n - 1,) float32 rest lengths
+        target: (dim,) float32 end effector target
+        base: (dim,) root position to pin on every backward pass
+        tol: Convergence tolerance on end effector distance
+        max_iter: Maximum number of forward/backward iterations
+    """
+    n, dim = positions.shape
+    for iteration in range(max_iter):
+        # Forward reaching phase
+        for k in range(dim):
+            positions[n - 1, k] = target[k]
+        for i in range(n - 2, 0, -1):
+            _reach_kernel(positions, i, i + 1, bone_lengths[i])
+        
+        # Backward reaching phase
+        for k in range(dim):
+            positions[0, k] = base[k]
+        for i in range(n - 1):
+            _reach_kernel(positions, i + 1, i, bone_lengths[i])
+        
+        # Check if we've converged
+        distance_sq = 0.0
+        for k in range(dim):
+            d = positions[n - 1, k] - target[k]
+            distance_sq += d * d
+        if distance_sq < tol * tol:
+            break
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _fabrik_batch(positions_batch, bone_lengths_batch, targets, tol, max_iter):
+    """
+    Solve many independent chains with FABRIK, spread across CPU cores
+
+    Args:
+        positions_batch: (batch, n, dim) float32 joint positions, updated in place
+        bone_lengths_batch: (batch, n - 1) float32 rest lengths
+        targets: (batch, dim) float32 end effector targets
+        tol: Convergence tolerance on end effector distance
+        max_iter: Maximum number of forward/backward iterations
+    """
+    for c in prange(positions_batch.shape[0]):
+        positions = positions_batch[c]
+        _fabrik_kernel(positions, bone_lengths_batch[c], targets[c],
+                       positions[0].copy(), tol, max_iter)
+
+
+@njit(cache=True, fastmath=True, inline='always')
+def _reach_lanes_kernel(positions, i, anchor, lengths, scale):
+    """_reach_kernel across every chain of a (n, dim, batch) positions array"""
+    dim, batch = positions.shape[1], positions.shape[2]
+    for b in range(batch):
+        scale[b] = 0.0
+    for k in range(dim):
+        for b in range(batch):
+            d = positions[i, k, b] - positions[anchor, k, b]
+            scale[b] += d * d
+    for b in range(batch):
+        distance = math.sqrt(scale[b])
+        scale[b] = lengths[b] / distance if distance > 1e-6 else 1.0
+    for k in range(dim):
+        for b in range(batch):
+            positions[i, k, b] = (positions[anchor, k, b] +
+                                  (positions[i, k, b] - positions[anchor, k, b]) * scale[b])
+
+
+@njit(cache=True, fastmath=True)
+def _fabrik_lanes_kernel(positions, bone_lengths, targets, base, tol, max_iter):
+    """
+    Compiled FABRIK over chains packed along the last (contiguous) axis
+
+    Every joint update is a loop over the batch axis, so the compiler can
+    process several chains per SIMD instruction. Iteration stops once all
+    chains are within tolerance. The forward sweep skips joint 0 as in
+    _fabrik_kernel.
+
+    Args:
+        positions: (n, dim, batch) float32 joint positions, updated in place
+        bone_lengths: (n - 1, batch) float32 rest lengths
+        targets: (dim, batch) float32 end effector targets
+        base: (dim, batch) root positions to pin on every backward pass
+        tol: Convergence tolerance on end effector distance
+        max_iter: Maximum number of forward/backward iterations
+    """
+    n, dim, batch = positions.shape
+    scale = np.empty(batch, dtype=positions.dtype)
+    for iteration in range(max_iter):
+        # Forward reaching phase
+        positions[n - 1] = targets
+        for i in range(n - 2, 0, -1):
+            _reach_lanes_kernel(positions, i, i + 1, bone_lengths[i], scale)
+        
+        # Backward reaching phase
+        positions[0] = base
+        for i in range(n - 1):
+            _reach_lanes_kernel(positions, i + 1, i, bone_lengths[i], scale)
+        
+        # Check if every chain has converged
+        worst_sq = 0.0
+        for b in range(batch):
+            distance_sq = 0.0
+            for k in range(dim):
+                d = positions[n - 1, k, b] - targets[k, b]
+                distance_sq += d * d
+            worst_sq = max(worst_sq, distance_sq)
+        if worst_sq < tol * tol:
+            break
+
+
+@njit(cache=True, fastmath=True)
+def _ccd_kernel(positions, target, tol, max_iter):
+    """
+    Compiled CCD iterations, updating positions in place
+
+    Rotations happen in the XY plane, so the angle is measured between the
+    XY projections; any z coordinate is carried along unchanged, matching
+    CCDSolver._rotate_joints.
+    """
+    n, dim = positions.shape
+    for iteration in range(max_iter):
+        # Iterate from end effector backwards to root
+        for i in range(n - 2, -1, -1):
+            # Vectors from current joint to end effector and target
+            ex = positions[n - 1, 0] - positions[i, 0]
+            ey = positions[n - 1, 1] - positions[i, 1]
+            tx = target[0] - positions[i, 0]
+            ty = target[1] - positions[i, 1]
+            
+            if ex * ex + ey * ey < 1e-12 or tx * tx + ty * ty < 1e-12:
+                continue
+            
+            # Signed rotation angle straight from cross and dot products
+            angle = math.atan2(ex * ty - ey * tx, ex * tx + ey * ty)
+            
+            # Rotate all joints after current joint
+            if abs(angle) > 1e-6:
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
+                px = positions[i, 0]
+                py = positions[i, 1]
+                for j in range(i + 1, n):
+                    rx = positions[j, 0] - px
+                    ry = positions[j, 1] - py
+                    positions[j, 0] = px + cos_a * rx - sin_a * ry
+                    positions[j, 1] = py + sin_a * rx + cos_a * ry
+        
+        # Check convergence
+        distance_sq = 0.0
+        for k in range(dim):
+            d = positions[n - 1, k] - target[k]
+            distance_sq += d * d
+        if distance_sq < tol * tol:
+            break
+
+
+@njit(cache=True, fastmath=True)
+def _fabrik3(p0x, p0y, p1x, p1y, p2x, p2y, l0, l1, tx, ty, tol, max_iter):
+    """
+    FABRIK unrolled for a 2D two-bone chain (shoulder/elbow/wrist)
+
+    Works purely on scalars so every coordinate can stay in a register.
+    Returns the solved (p0x, p0y, p1x, p1y, p2x, p2y).
+    """
+    tol_sq = tol * tol
+    for iteration in range(max_iter):
+        # Forward reaching phase
+        p2x = tx
+        p2y = ty
+        dx = p1x - p2x
+        dy = p1y - p2y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance > 1e-6:
+            scale = l1 / distance
+            p1x = p2x + dx * scale
+            p1y = p2y + dy * scale
+        
+        # Backward reaching phase (the shoulder stays pinned to the base,
+        # so the forward pass never needs to move it)
+        dx = p1x - p0x
+        dy = p1y - p0y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance > 1e-6:
+            scale = l0 / distance
+            p1x = p0x + dx * scale
+            p1y = p0y + dy * scale
+        dx = p2x - p1x
+        dy = p2y - p1y
+        distance = math.sqrt(dx * dx + dy * dy)
+        if distance > 1e-6:
+            scale = l1 / distance
+            p2x = p1x + dx * scale
+            p2y = p1y + dy * scale
+        
+        # Check if we've converged
+        dx = p2x - tx
+        dy = p2y - ty
+        if dx * dx + dy * dy < tol_sq:
+            break
+    return p0x, p0y, p1x, p1y, p2x, p2y
+
+
+@njit(cache=True, fastmath=True)
+def _ccd3(p0x, p0y, p1x, p1y, p2x, p2y, tx, ty, tol, max_iter):
+    """
+    CCD unrolled for a 2D two-bone chain (shoulder/elbow/wrist)
+
+    Returns the solved (p0x, p0y, p1x, p1y, p2x, p2y).
+    """
+    tol_sq = tol * tol
+    for iteration in range(max_iter):
+        # Elbow: rotate the wrist about it
+        ex = p2x - p1x
+        ey = p2y - p1y
+        gx = tx - p1x
+        gy = ty - p1y
+        if ex * ex + ey * ey >= 1e-12 and gx * gx + gy * gy >= 1e-12:
+            angle = math.atan2(ex * gy - ey * gx, ex * gx + ey * gy)
+            if abs(angle) > 1e-6:
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
+                p2x = p1x + cos_a * ex - sin_a * ey
+                p2y = p1y + sin_a * ex + cos_a * ey
+        
+        # Shoulder: rotate elbow and wrist about it
+        ex = p2x - p0x
+        ey = p2y - p0y
+        gx = tx - p0x
+        gy = ty - p0y
+        if ex * ex + ey * ey >= 1e-12 and gx * gx + gy * gy >= 1e-12:
+            angle = math.atan2(ex * gy - ey * gx, ex * gx + ey * gy)
+            if abs(angle) > 1e-6:
+                cos_a = math.cos(angle)
+                sin_a = math.sin(angle)
+                rx = p1x - p0x
+                ry = p1y - p0y
+                p1x = p0x + cos_a * rx - sin_a * ry
+                p1y = p0y + sin_a * rx + cos_a * ry
+                p2x = p0x + cos_a * ex - sin_a * ey
+                p2y = p0y + sin_a * ex + cos_a * ey
+        
+        # Check convergence
+        dx = p2x - tx
+        dy = p2y - ty
+        if dx * dx + dy * dy < tol_sq:
+            break
+    return p0x, p0y, p1x, p1y, p2x, p2y
 
 
 class FABRIKSolver:
@@ -48,13 +419,44 @@ class FABRIKSolver:
     
     Time Complexity: O(n * iterations) where n is number of joints
     Space Complexity: O(n)
+    
+    backend='jax' routes solves through the XLA-compiled solver in
+    ik_solvers_jax, and backend='c' through the ahead-of-time compiled kernel
+    in ik_kernel (no JIT warm-up), instead of the Numba/Python paths.
     """
     
-    def __init__(self, tolerance: float = 0.01, max_iterations: int = 10):
+    def __init__(self, tolerance: float = 0.01, max_iterations: int = 10,
+                 backend: str = 'default'):
         self.tolerance = tolerance
         self.max_iterations = max_iterations
         self.solve_time = 0.0
         
+        self._jax = None
+        self._c_kernel = None
+        if backend == 'jax':
+            try:
+                import ik_solvers_jax
+            except ImportError:
+                raise ImportError("JAX is required for the 'jax' backend")
+            self._jax = ik_solvers_jax
+        elif backend == 'c':
+            import ik_kernel
+            self._c_kernel = ik_kernel
+        elif backend != 'default':
+            raise ValueError(f"Unknown backend: {backend}")
+        
+        # Scratch vectors reused across solves, resized if the chain dimension changes
+        self._dir = np.empty(0, dtype=np.float32)
+        self._base = np.empty(0, dtype=np.float32)
+        self._target = np.empty(0, dtype=np.float32)
+        
+    def _ensure_scratch(self, dim: int):
+        """(Re)allocate the scratch vectors for chains of the given dimension"""
+        if self._dir.shape[0] != dim:
+            self._dir = np.empty(dim, dtype=np.float32)
+            self._base = np.empty(dim, dtype=np.float32)
+            self._target = np.empty(dim, dtype=np.float32)
+        
     def solve(self, chain: IKChain, target: np.ndarray, 
               constraints: Optional[dict] = None) -> IKChain:
         """
@@ -70,55 +472,167 @@ class FABRIKSolver:
         """
         start_time = time.perf_counter()
         
+        positions = chain.positions
+        bone_lengths = chain.bone_lengths
+        self._ensure_scratch(positions.shape[1])
+        np.copyto(self._target, target)
+        np.copyto(self._base, positions[0])
+        
+        # Already within tolerance (e.g. warm-started from the previous frame)
+        np.subtract(positions[-1], self._target, out=self._dir)
+        if float(self._dir @ self._dir) < self.tolerance * self.tolerance:
+            self.solve_time = time.perf_counter() - start_time
+            return chain
+        
         # Check if target is reachable
-        if not chain.is_reachable(target):
+        if not chain.is_reachable(self._target):
             # Target out of reach - stretch towards it
-            direction = (target - chain.joints[0].position)
-            direction = direction / np.linalg.norm(direction)
-            chain.joints[-1].position = (chain.joints[0].position + 
-                                         direction * chain.total_length)
+            np.subtract(self._target, positions[0], out=self._dir)
+            self._dir *= chain.total_length / np.linalg.norm(self._dir)
+            np.add(positions[0], self._dir, out=positions[-1])
         
-        base_position = chain.joints[0].position.copy()
+        if self._jax is not None:
+            np.copyto(positions, self._jax.solve(positions, bone_lengths, self._target,
+                                                 self.tolerance, self.max_iterations))
+        elif self._c_kernel is not None:
+            self._c_kernel.fabrik_solve(positions, bone_lengths, self._target,
+                                        self.tolerance, self.max_iterations)
+        elif positions.shape == (3, 2):
+            # Two-bone 2D arm/leg: fully unrolled scalar solve
+            (p0x, p0y), (p1x, p1y), (p2x, p2y) = positions.tolist()
+            upper_length, lower_length = bone_lengths.tolist()
+            tx, ty = self._target.tolist()
+            positions.ravel()[:] = _fabrik3(p0x, p0y, p1x, p1y, p2x, p2y,
+                                            upper_length, lower_length, tx, ty,
+                                            self.tolerance, self.max_iterations)
+        elif NUMBA_AVAILABLE:
+            _fabrik_kernel(positions, bone_lengths, self._target, self._base,
+                           self.tolerance, self.max_iterations)
+        else:
+            self._solve_python(positions, bone_lengths, self._target)
+        
+        self.solve_time = time.perf_counter() - start_time
+        return chain
+    
+    def _solve_python(self, positions: np.ndarray, bone_lengths: np.ndarray,
+                      target: np.ndarray):
+        """Pure Python FABRIK iterations, used when Numba is unavailable"""
+        n = len(positions)
+        
+        # The passes below work on 2/3-vectors, where numpy's per-call
+        # dispatch dwarfs the arithmetic, so iterate on Python floats and
+        # write the result back to the packed array once at the end
+        points = positions.tolist()
+        lengths = bone_lengths.tolist()
+        goal = target.tolist()
+        base_position = points[0][:]
         
         for iteration in range(self.max_iterations):
             # Forward reaching phase
-            chain.joints[-1].position = target.copy()
+            points[-1][:] = goal
             
-            for i in range(len(chain.joints) - 2, -1, -1):
-                # Calculate direction from joint i+1 to joint i
-                direction = chain.joints[i].position - chain.joints[i + 1].position
-                distance = np.linalg.norm(direction)
-                
-                if distance > 1e-6:  # Avoid division by zero
-                    direction = direction / distance
-                    # Place joint i at correct distance from joint i+1
-                    chain.joints[i].position = (chain.joints[i + 1].position + 
-                                               direction * chain.bone_lengths[i])
+            for i in range(n - 2, 0, -1):
+                # Place joint i at correct distance from joint i+1
+                _place_joint(points[i], points[i + 1], lengths[i])
             
             # Backward reaching phase
-            chain.joints[0].position = base_position.copy()
+            points[0][:] = base_position
             
-            for i in range(len(chain.joints) - 1):
-                # Calculate direction from joint i to joint i+1
-                direction = chain.joints[i + 1].position - chain.joints[i].position
-                distance = np.linalg.norm(direction)
-                
-                if distance > 1e-6:
-                    direction = direction / distance
-                    # Place joint i+1 at correct distance from joint i
-                    chain.joints[i + 1].position = (chain.joints[i].position + 
-                                                   direction * chain.bone_lengths[i])
+            for i in range(n - 1):
+                # Place joint i+1 at correct distance from joint i
+                _place_joint(points[i + 1], points[i], lengths[i])
             
             # Check if we've converged
-            end_effector_distance = np.linalg.norm(
-                chain.joints[-1].position - target
-            )
-            
-            if end_effector_distance < self.tolerance:
+            if math.dist(points[-1], goal) < self.tolerance:
                 break
         
+        positions[:] = points
+
+
+class FABRIKBatchSolver:
+    """
+    FABRIK solver for many chains with the same joint count
+
+    Chains are stored structure-of-arrays style as (n_joints, dim, batch),
+    so for a given joint and axis the coordinates of every chain sit next
+    to each other in memory and each solver step runs across all chains
+    at once. Chains that converge early keep iterating until the whole
+    batch is within tolerance.
+    """
+    
+    def __init__(self, tolerance: float = 0.01, max_iterations: int = 10):
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.solve_time = 0.0
+    
+    @staticmethod
+    def pack(chains: List[IKChain]) -> Tuple[np.ndarray, np.ndarray]:
+        """Pack chains into (n_joints, dim, batch) positions and (n_joints - 1, batch) bone lengths"""
+        stacked = np.stack([c.positions for c in chains], axis=-1)
+        positions = _aligned_empty(stacked.shape)
+        np.copyto(positions, stacked)
+        bone_lengths = np.ascontiguousarray(np.stack([c.bone_lengths for c in chains], axis=-1))
+        return positions, bone_lengths
+    
+    @staticmethod
+    def unpack(positions: np.ndarray, chains: List[IKChain]):
+        """Copy solved batch positions back into their chains"""
+        for b, chain in enumerate(chains):
+            chain.positions[:] = positions[:, :, b]
+    
+    def solve(self, positions: np.ndarray, bone_lengths: np.ndarray,
+              targets: np.ndarray) -> np.ndarray:
+        """
+        Solve IK for every chain in the batch
+        
+        Args:
+            positions: (n_joints, dim, batch) float32 positions, updated in place
+            bone_lengths: (n_joints - 1, batch) bone lengths
+            targets: (dim, batch) end effector targets
+            
+        Returns:
+            The solved positions array
+        """
+        start_time = time.perf_counter()
+        
+        bone_lengths = np.ascontiguousarray(bone_lengths, dtype=np.float32)
+        targets = np.ascontiguousarray(targets, dtype=np.float32)
+        
+        if NUMBA_AVAILABLE:
+            _fabrik_lanes_kernel(positions, bone_lengths, targets, positions[0].copy(),
+                                 self.tolerance, self.max_iterations)
+        else:
+            self._solve_numpy(positions, bone_lengths, targets)
+        
         self.solve_time = time.perf_counter() - start_time
-        return chain
+        return positions
+    
+    def _solve_numpy(self, positions: np.ndarray, bone_lengths: np.ndarray,
+                     targets: np.ndarray):
+        """Batch-vectorized numpy FABRIK, used when Numba is unavailable"""
+        base_position = positions[0].copy()
+        
+        for iteration in range(self.max_iterations):
+            # Forward reaching phase
+            positions[-1] = targets
+            for i in range(len(positions) - 2, 0, -1):
+                direction = positions[i] - positions[i + 1]
+                distance = np.sqrt((direction * direction).sum(axis=0))
+                scale = np.where(distance > 1e-6, bone_lengths[i] / np.maximum(distance, 1e-6), 1.0)
+                positions[i] = positions[i + 1] + direction * scale
+            
+            # Backward reaching phase
+            positions[0] = base_position
+            for i in range(len(positions) - 1):
+                direction = positions[i + 1] - positions[i]
+                distance = np.sqrt((direction * direction).sum(axis=0))
+                scale = np.where(distance > 1e-6, bone_lengths[i] / np.maximum(distance, 1e-6), 1.0)
+                positions[i + 1] = positions[i] + direction * scale
+            
+            # Check if every chain has converged
+            error = positions[-1] - targets
+            if (error * error).sum(axis=0).max() < self.tolerance * self.tolerance:
+                break
 
 
 class CCDSolver:
@@ -151,73 +665,74 @@ class CCDSolver:
         """
         start_time = time.perf_counter()
         
+        positions = chain.positions
+        target = np.asarray(target, dtype=np.float32)
+        
+        if positions.shape == (3, 2):
+            # Two-bone 2D arm/leg: fully unrolled scalar solve
+            (p0x, p0y), (p1x, p1y), (p2x, p2y) = positions.tolist()
+            tx, ty = target.tolist()
+            positions.ravel()[:] = _ccd3(p0x, p0y, p1x, p1y, p2x, p2y, tx, ty,
+                                         self.tolerance, self.max_iterations)
+        elif NUMBA_AVAILABLE:
+            _ccd_kernel(positions, target, self.tolerance, self.max_iterations)
+        else:
+            self._solve_python(chain, target)
+        
+        self.solve_time = time.perf_counter() - start_time
+        return chain
+    
+    def _solve_python(self, chain: IKChain, target: np.ndarray):
+        """Pure Python CCD iterations, used when Numba is unavailable"""
+        positions = chain.positions
+        tolerance_sq = self.tolerance * self.tolerance
+        goal_x, goal_y = target[:2].tolist()
+        
         for iteration in range(self.max_iterations):
             # Iterate from end effector backwards to root
-            for i in range(len(chain.joints) - 2, -1, -1):
-                end_effector = chain.joints[-1].position
-                joint = chain.joints[i].position
+            for i in range(len(positions) - 2, -1, -1):
+                # Pull the joint and end effector out as Python floats; numpy
+                # dispatch costs far more than the arithmetic on 2-vectors
+                jx, jy = positions[i, :2].tolist()
+                end_x, end_y = positions[-1, :2].tolist()
                 
                 # Vectors from current joint to end effector and target
-                to_end = end_effector - joint
-                to_target = target - joint
+                ex = end_x - jx
+                ey = end_y - jy
+                tx = goal_x - jx
+                ty = goal_y - jy
                 
-                # Calculate rotation angle
-                to_end_norm = np.linalg.norm(to_end)
-                to_target_norm = np.linalg.norm(to_target)
-                
-                if to_end_norm < 1e-6 or to_target_norm < 1e-6:
+                if ex * ex + ey * ey < 1e-12 or tx * tx + ty * ty < 1e-12:
                     continue
                 
-                # Normalize vectors
-                to_end = to_end / to_end_norm
-                to_target = to_target / to_target_norm
-                
-                # Calculate rotation angle using dot product
-                cos_angle = np.clip(np.dot(to_end, to_target), -1.0, 1.0)
-                angle = np.arccos(cos_angle)
-                
-                # Determine rotation direction (2D case)
-                if len(joint) == 2:  # 2D
-                    cross = to_end[0] * to_target[1] - to_end[1] * to_target[0]
-                    if cross < 0:
-                        angle = -angle
+                # Signed rotation angle straight from cross and dot products
+                angle = math.atan2(ex * ty - ey * tx, ex * tx + ey * ty)
                 
                 # Rotate all joints after current joint
                 if abs(angle) > 1e-6:
                     self._rotate_joints(chain, i, angle)
             
             # Check convergence
-            end_effector_distance = np.linalg.norm(
-                chain.joints[-1].position - target
-            )
-            
-            if end_effector_distance < self.tolerance:
+            error = positions[-1] - target
+            if error @ error < tolerance_sq:
                 break
-        
-        self.solve_time = time.perf_counter() - start_time
-        return chain
     
     def _rotate_joints(self, chain: IKChain, pivot_index: int, angle: float):
         """Rotate joints around pivot joint (2D rotation)"""
-        pivot = chain.joints[pivot_index].position
-        cos_a = np.cos(angle)
-        sin_a = np.sin(angle)
+        positions = chain.positions
+        pivot = positions[pivot_index, :2]
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
         
         rotation_matrix = np.array([
             [cos_a, -sin_a],
             [sin_a, cos_a]
-        ])
+        ], dtype=np.float32)
         
-        # Rotate all joints after the pivot
-        for i in range(pivot_index + 1, len(chain.joints)):
-            relative = chain.joints[i].position - pivot
-            rotated = rotation_matrix @ relative[:2]  # 2D rotation
-            
-            if len(chain.joints[i].position) == 2:
-                chain.joints[i].position = pivot + rotated
-            else:  # 3D - keep z coordinate
-                chain.joints[i].position[:2] = pivot[:2] + rotated
-                
+        # Rotate all joints after the pivot in one matmul (3D keeps its z coordinate)
+        relative = positions[pivot_index + 1:, :2] - pivot
+        positions[pivot_index + 1:, :2] = relative @ rotation_matrix.T + pivot
+
 
 class PoleVectorConstraint:
     """
@@ -236,26 +751,29 @@ class PoleVectorConstraint:
             chain: The kinematic chain
             joint_index: Index of joint to constrain (usually middle of chain)
         """
-        if joint_index <= 0 or joint_index >= len(chain.joints) - 1:
+        positions = chain.positions
+        if joint_index <= 0 or joint_index >= len(positions) - 1:
             return
         
-        start = chain.joints[joint_index - 1].position
-        end = chain.joints[joint_index + 1].position
-        current = chain.joints[joint_index].position
+        # Work on Python floats: these are 2/3-vectors, so numpy temporaries
+        # would cost more than the arithmetic itself
+        start = positions[joint_index - 1].tolist()
+        end = positions[joint_index + 1].tolist()
+        current = positions[joint_index].tolist()
+        pole = np.asarray(self.pole_position).tolist()
         
         # Calculate midpoint between start and end
-        mid = (start + end) / 2
+        mid = [0.5 * (s + e) for s, e in zip(start, end)]
         
-        # Vector from mid to current joint
-        to_current = current - mid
-        to_current_dist = np.linalg.norm(to_current)
+        # Distance from mid to current joint
+        to_current_dist = math.dist(current, mid)
         
-        # Vector from mid to pole
-        to_pole = self.pole_position - mid
-        to_pole_norm = to_pole / np.linalg.norm(to_pole)
+        # Vector from mid to pole, scaled straight to the current distance
+        to_pole = [p - m for p, m in zip(pole, mid)]
+        scale = to_current_dist / math.hypot(*to_pole)
         
         # Project current joint onto pole direction
-        chain.joints[joint_index].position = mid + to_pole_norm * to_current_dist
+        positions[joint_index] = [m + p * scale for m, p in zip(mid, to_pole)]
 
 
 def benchmark_solvers(num_trials: int = 100):
@@ -272,27 +790,33 @@ def benchmark_solvers(num_trials: int = 100):
     fabrik_solver = FABRIKSolver(tolerance=0.01, max_iterations=10)
     ccd_solver = CCDSolver(tolerance=0.01, max_iterations=15)
     
-    for _ in range(num_trials):
-        # Create test chain (3-joint arm)
-        joints = [
-            Joint(np.array([0.0, 0.0])),
-            Joint(np.array([1.0, 0.0])),
-            Joint(np.array([2.0, 0.0]))
-        ]
-        chain1 = IKChain(joints)
-        
-        joints2 = [Joint(j.position.copy()) for j in joints]
-        chain2 = IKChain(joints2)
-        
-        # Random target
-        target = np.random.rand(2) * 2.0
-        
-        # Solve with both
+    # Test chain (3-joint arm) rest pose and all random targets, generated up front
+    template = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0]], dtype=np.float32)
+    rng = np.random.default_rng(0)
+    targets = rng.random((num_trials, 2), dtype=np.float32) * np.float32(2.0)
+    
+    chain1 = IKChain([Joint(p) for p in template])
+    chain2 = IKChain([Joint(p) for p in template])
+    
+    # Warm up so JIT compilation isn't counted in the first trial
+    fabrik_solver.solve(chain1, np.array([1.0, 1.0], dtype=np.float32))
+    ccd_solver.solve(chain2, np.array([1.0, 1.0], dtype=np.float32))
+    
+    # Solver statistics come from each solve's own solve_time; one clock pair
+    # around each trial loop gives the per-trial loop time (incl. reset)
+    start_ns = time.perf_counter_ns()
+    for target in targets:
+        chain1.reset(template)
         fabrik_solver.solve(chain1, target)
-        ccd_solver.solve(chain2, target)
-        
         fabrik_times.append(fabrik_solver.solve_time * 1000)  # Convert to ms
+    fabrik_loop_time = (time.perf_counter_ns() - start_ns) / 1e6 / num_trials
+    
+    start_ns = time.perf_counter_ns()
+    for target in targets:
+        chain2.reset(template)
+        ccd_solver.solve(chain2, target)
         ccd_times.append(ccd_solver.solve_time * 1000)
+    ccd_loop_time = (time.perf_counter_ns() - start_ns) / 1e6 / num_trials
     
     print(f"FABRIK Average: {np.mean(fabrik_times):.3f}ms")
     print(f"FABRIK Std Dev: {np.std(fabrik_times):.3f}ms")
@@ -303,6 +827,39 @@ def benchmark_solvers(num_trials: int = 100):
     print(f"CCD Min/Max: {np.min(ccd_times):.3f}ms / {np.max(ccd_times):.3f}ms\n")
     
     print(f"FABRIK is {np.mean(ccd_times) / np.mean(fabrik_times):.2f}x faster")
+    print(f"Per-trial loop time (incl. reset): FABRIK {fabrik_loop_time:.3f}ms, "
+          f"CCD {ccd_loop_time:.3f}ms\n")
+    
+    # Batched FABRIK: all trials solved in one call
+    positions_batch = _aligned_empty((num_trials, 3, 2))
+    positions_batch[:] = template
+    bone_lengths_batch = np.ascontiguousarray(
+        np.broadcast_to(chain1.bone_lengths, (num_trials, len(chain1.bone_lengths))))
+    
+    _fabrik_batch(positions_batch[:1].copy(), bone_lengths_batch[:1], targets[:1],
+                  fabrik_solver.tolerance, fabrik_solver.max_iterations)
+    
+    start_time = time.perf_counter()
+    _fabrik_batch(positions_batch, bone_lengths_batch, targets,
+                  fabrik_solver.tolerance, fabrik_solver.max_iterations)
+    batch_time = (time.perf_counter() - start_time) * 1000
+    
+    print(f"FABRIK Batch ({num_trials} chains): {batch_time:.3f}ms total, "
+          f"{batch_time / num_trials:.4f}ms per chain")
+    
+    # Same workload with chains packed along the SIMD-friendly last axis
+    batch_solver = FABRIKBatchSolver(tolerance=0.01, max_iterations=10)
+    lane_positions = _aligned_empty((3, 2, num_trials))
+    lane_positions[:] = template[:, :, None]
+    lane_bone_lengths = np.ascontiguousarray(
+        np.broadcast_to(chain1.bone_lengths[:, None], (len(chain1.bone_lengths), num_trials)))
+    
+    batch_solver.solve(lane_positions[:, :, :1].copy(), lane_bone_lengths[:, :1], targets[:1].T)
+    batch_solver.solve(lane_positions, lane_bone_lengths, targets.T)
+    lane_time = batch_solver.solve_time * 1000
+    
+    print(f"FABRIK SoA Batch ({num_trials} chains): {lane_time:.3f}ms total, "
+          f"{lane_time / num_trials:.4f}ms per chain")
 
 
 if __name__ == "__main__":
@@ -324,6 +881,10 @@ if __name__ == "__main__":
     # Solve with FABRIK
     print("Solving with FABRIK...")
     solver = FABRIKSolver()
+    
+    # Warm up on a throwaway chain so JIT compilation isn't timed
+    solver.solve(IKChain([Joint(j.position.copy()) for j in joints]), target)
+    
     solved_chain = solver.solve(chain, target)
     
     print(f"Solution found in {solver.solve_time * 1000:.3f}ms")
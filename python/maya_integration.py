@@ -12,7 +12,8 @@ except ImportError:
     print("Warning: Maya not available. This module requires Maya to run.")
 
 import json
-import numpy as np
+import math
+from contextlib import contextmanager
 from typing import List, Dict, Tuple, Optional
 
 
@@ -125,6 +126,17 @@ class MayaRigBuilder:
         
         return nodes
     
+    @contextmanager
+    def _batched_edits(self, chunk_name: str):
+        """Group scene edits into one undo chunk with viewport refresh suspended"""
+        cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+        cmds.refresh(suspend=True)
+        try:
+            yield
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
+    
     def _create_control(self, name: str, shape: str, position: List[float], 
                        scale: float = 1.0) -> str:
         """Create a NURBS control curve"""
@@ -184,8 +196,7 @@ class MayaRigBuilder:
         cmds.parent(shoulder_loc, shoulder)
         cmds.parent(wrist_loc, ik_ctrl)
         
-        cmds.setAttr(f'{shoulder_loc}.v', 0)
-        cmds.setAttr(f'{wrist_loc}.v', 0)
+        cmds.hide(shoulder_loc, wrist_loc)
         
         # Distance between node
         distance_node = cmds.createNode('distanceBetween', n=f'{side}_arm_stretch_dist')
@@ -225,7 +236,7 @@ class MayaRigBuilder:
     @staticmethod
     def _distance(pos1: List[float], pos2: List[float]) -> float:
         """Calculate distance between two points"""
-        return np.sqrt(sum((a - b) ** 2 for a, b in zip(pos1, pos2)))
+        return math.dist(pos1, pos2)
     
     def import_animation_from_json(self, json_path: str):
         """
@@ -260,28 +271,26 @@ class MayaRigBuilder:
             'root': None
         }
         
-        # Create root control
-        root_ctrl = self._create_control(
-            name=f'{name}_root_ctrl',
-            shape='square',
-            position=[0, 0, 0],
-            scale=2.0
-        )
-        rig_data['root'] = root_ctrl
-        
-        # Create arms
-        rig_data['left_arm'] = self.create_ik_arm_rig(side='L')
-        rig_data['right_arm'] = self.create_ik_arm_rig(side='R')
-        
-        # Group everything
-        rig_grp = cmds.group(empty=True, n=f'{name}_rig_grp')
-        
-        if rig_data['left_arm']:
-            cmds.parent(rig_data['left_arm']['control_group'], rig_grp)
-        if rig_data['right_arm']:
-            cmds.parent(rig_data['right_arm']['control_group'], rig_grp)
-        
-        cmds.parent(root_ctrl, rig_grp)
+        with self._batched_edits(f'{name}_rig_build'):
+            # Create root control
+            root_ctrl = self._create_control(
+                name=f'{name}_root_ctrl',
+                shape='square',
+                position=[0, 0, 0],
+                scale=2.0
+            )
+            rig_data['root'] = root_ctrl
+            
+            # Create arms
+            rig_data['left_arm'] = self.create_ik_arm_rig(side='L')
+            rig_data['right_arm'] = self.create_ik_arm_rig(side='R')
+            
+            # Group everything in one parent call
+            rig_grp = cmds.group(empty=True, n=f'{name}_rig_grp')
+            
+            children = [arm['control_group'] for arm in (rig_data['left_arm'], rig_data['right_arm'])
+                        if arm]
+            cmds.parent(*children, root_ctrl, rig_grp)
         
         print(f"✓ Created full character rig: {name}")
         print(f"  - Left arm with IK/PV")
@@ -0,0 +1,50 @@
+"""
+Build script for the compiled FABRIK kernel used by FABRIKSolver(backend='c')
+
+Builds ik_kernel.c as a plain shared library (not a Python extension module,
+so no PyInit symbol is required) next to this file, where ik_kernel.py loads
+it through ctypes.
+
+Usage: python setup_ik_kernel.py
+"""
+
+import os
+import sys
+
+import setuptools  # noqa: F401  (provides distutils on Python 3.12+)
+from distutils.ccompiler import new_compiler
+from distutils.sysconfig import customize_compiler
+
+if sys.platform == 'win32':
+    LIBRARY_NAME = '_ik_kernel.dll'
+    COMPILE_ARGS = ['/O2', '/fp:fast']
+elif sys.platform == 'darwin':
+    LIBRARY_NAME = '_ik_kernel.dylib'
+    COMPILE_ARGS = ['-O3', '-march=native', '-ffast-math', '-fPIC']
+else:
+    LIBRARY_NAME = '_ik_kernel.so'
+    COMPILE_ARGS = ['-O3', '-march=native', '-ffast-math', '-fPIC']
+
+
+def build():
+    """Compile and link ik_kernel.c into LIBRARY_NAME"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    compiler = new_compiler()
+    customize_compiler(compiler)
+    
+    objects = compiler.compile(
+        [os.path.join(here, 'ik_kernel.c')],
+        output_dir=os.path.join(here, 'build'),
+        extra_postargs=COMPILE_ARGS,
+    )
+    # Exports come from IK_EXPORT in the C source
+    compiler.link_shared_object(
+        objects,
+        LIBRARY_NAME,
+        output_dir=here,
+    )
+    print(f"Built {os.path.join(here, LIBRARY_NAME)}")
+
+
+if __name__ == '__main__':
+    build()